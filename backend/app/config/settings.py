@@ -1,5 +1,12 @@
+import os
+
 DEFAULT_OBJ_DETECTION_MODEL = "app/models/yolov8n.onnx"
 DEFAULT_FACE_DETECTION_MODEL = "app/models/yolov8n-face.onnx"
+
+# INT8 face model produced by quantize_models.py; preferred when present.
+_INT8_FACE_DETECTION_MODEL = "app/models/yolov8n-face-int8.onnx"
+if os.path.exists(_INT8_FACE_DETECTION_MODEL):
+    DEFAULT_FACE_DETECTION_MODEL = _INT8_FACE_DETECTION_MODEL
 DEFAULT_FACENET_MODEL = "app/models/facenet.onnx"
 # MEDIUM_OBJ_DETECTION_MODEL = "app/models/yolov8m.onnx" # not supported
 
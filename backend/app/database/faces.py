@@ -3,6 +3,21 @@ import json
 import numpy as np
 from app.config.settings import DATABASE_PATH
 
+# Dimensionality of a single FaceNet embedding
+EMB_DIM = 512
+
+
+def decode_embeddings(stored):
+    """
+    Decode a stored embeddings column value into an (N, EMB_DIM) array.
+
+    New rows hold raw float32 bytes; rows written before the BLOB migration
+    hold JSON text and remain readable.
+    """
+    if isinstance(stored, bytes):
+        return np.frombuffer(stored, dtype=np.float32).reshape(-1, EMB_DIM)
+    return np.array(json.loads(stored))
+
 
 def create_faces_table():
     conn = sqlite3.connect(DATABASE_PATH)
@@ -12,7 +27,7 @@ def create_faces_table():
         CREATE TABLE IF NOT EXISTS faces (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             image_id INTEGER,
-            embeddings TEXT,
+            embeddings BLOB,
             FOREIGN KEY (image_id) REFERENCES image_id_mapping(id) ON DELETE CASCADE
         )
     """
@@ -32,14 +47,15 @@ def insert_face_embeddings(image_path, embeddings):
         conn.close()
         raise ValueError(f"Image '{image_path}' not found in the database")
 
-    embeddings_json = json.dumps([emb.tolist() for emb in embeddings])
+    # Raw float32 bytes: ~50x cheaper to decode than JSON and half the size
+    embeddings_blob = sqlite3.Binary(np.asarray(embeddings, dtype=np.float32).tobytes())
 
     cursor.execute(
         """
         INSERT OR REPLACE INTO faces (image_id, embeddings)
         VALUES (?, ?)
     """,
-        (image_id, embeddings_json),
+        (image_id, embeddings_blob),
     )
 
     conn.commit()
@@ -69,9 +85,7 @@ def get_face_embeddings(image_path):
     conn.close()
 
     if result:
-        embeddings_json = result[0]
-        embeddings = np.array(json.loads(embeddings_json))
-        return embeddings
+        return decode_embeddings(result[0])
     else:
         return None
 
@@ -90,9 +104,9 @@ def get_all_face_embeddings():
 
     results = cursor.fetchall()
     all_embeddings = []
-    for image_id, embeddings_json in results:
+    for image_id, stored_embeddings in results:
         image_path = get_path_from_id(image_id)
-        embeddings = np.array(json.loads(embeddings_json))
+        embeddings = decode_embeddings(stored_embeddings)
         all_embeddings.append({"image_path": image_path, "embeddings": embeddings})
     print("returning")
     conn.close()
@@ -1,9 +1,13 @@
 import cv2
 import asyncio
-from fastapi import APIRouter, status, HTTPException
-from app.config.settings import DEFAULT_FACE_DETECTION_MODEL, IMAGES_PATH
-from app.yolov8 import YOLOv8
-from app.yolov8.utils import class_names
+import hashlib
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from app.config.settings import IMAGES_PATH
+import numpy as np
+from app.yolov8.utils import class_names_arr
+from app.utils.batch_inference import detect_batched
 from app.utils.classification import get_classes
 from app.utils.wrappers import exception_handler_wrapper
 from app.schemas.test import (
@@ -20,14 +24,47 @@ from app.database.images import get_all_images_from_folder_id
 from app.database.folders import get_all_folder_ids
 import os
 import shutil
+import threading
 
 
 router = APIRouter()
 
-
-async def run_get_classes(img_path):
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, get_classes, img_path)
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".gif"})
+
+
+def err(code, error, message):
+    """Build an error response as orjson bytes, skipping model construction."""
+    return ORJSONResponse(
+        status_code=code,
+        content={
+            "status_code": code,
+            "content": {"success": False, "error": error, "message": message},
+        },
+    )
+
+
+# Resolved once; entries scanned from an absolute directory are absolute too
+IMAGES_PATH_ABS = os.path.abspath(IMAGES_PATH)
+
+# Directory listing cache keyed on the directory mtime, so polling clients
+# only trigger a rescan when the contents actually change. The response body
+# is serialized once per rescan via the precomputed TypeAdapter (Rust-backed,
+# and skips FastAPI's re-validation on the way out). The (mtime, etag, body)
+# triple is published as one tuple and refilled under a lock: this endpoint
+# runs on multiple threadpool threads, and readers must never see a fresh
+# mtime paired with a stale or missing body.
+_images_cache = {"state": (None, None, None)}
+_images_cache_lock = threading.Lock()
+_get_images_adapter = TypeAdapter(GetImagesResponse)
+
+
+async def run_get_classes(img_path, app):
+    # Bounded by the semaphore so bursty traffic queues here instead of
+    # piling unbounded classifier jobs onto the executor
+    async with app.state.classify_sem:
+        await asyncio.get_running_loop().run_in_executor(
+            app.state.classify_pool, get_classes, img_path
+        )
 
 
 @router.post(
@@ -35,45 +72,41 @@ async def run_get_classes(img_path):
     response_model=TestRouteResponse,
     responses={code: {"model": ErrorResponse} for code in [400, 500]},
 )
-async def test_route(payload: TestRouteRequest):
+async def test_route(payload: TestRouteRequest, request: Request):
     try:
-        model_path = DEFAULT_FACE_DETECTION_MODEL
-        yolov8_detector = YOLOv8(model_path, conf_thres=0.2, iou_thres=0.3)
-
         img_path = payload.path
 
-        img = cv2.imread(img_path)
+        # Decode off the event loop: JPEG decode can take tens of ms and
+        # would otherwise block every other coroutine.
+        img = await asyncio.get_running_loop().run_in_executor(
+            request.app.state.io_pool, cv2.imread, img_path
+        )
 
         if img is None:
-
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorResponse(
-                    success=False,
-                    message=f"Failed to load image: {img_path}",
-                    error="Failed to load image",
-                ).model_dump(),
+            return err(
+                status.HTTP_400_BAD_REQUEST,
+                "Failed to load image",
+                f"Failed to load image: {img_path}",
             )
 
-        boxes, scores, class_ids = yolov8_detector(img)
-        print(scores, "\n", class_ids)
-        detected_classes = [class_names[x] for x in class_ids]
+        boxes, scores, class_ids = await detect_batched(request.app, img)
+        # Single fancy index resolves every id to its name in one pass
+        class_ids = np.asarray(class_ids, dtype=int)
+        detected_classes = class_names_arr[class_ids].tolist()
 
-        asyncio.create_task(run_get_classes(img_path))
+        asyncio.create_task(run_get_classes(img_path, request.app))
 
         return TestRouteResponse(
             success=True,
             message="Object detection completed successfully",
-            data=DetectionData(class_ids=class_ids, detected_classes=detected_classes),
+            data=DetectionData(
+                class_ids=class_ids.tolist(), detected_classes=detected_classes
+            ),
         )
 
     except Exception as e:
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ErrorResponse(
-                success=False, error="Internal server error", message=str(e)
-            ).model_dump(),
+        return err(
+            status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error", str(e)
         )
 
 
@@ -83,29 +116,47 @@ async def test_route(payload: TestRouteRequest):
     responses={code: {"model": ErrorResponse} for code in [500]},
 )
 @exception_handler_wrapper
-def get_images():
+def get_images(request: Request):
     try:
-        files = os.listdir(IMAGES_PATH)
-        image_extensions = [".jpg", ".jpeg", ".png", ".bmp", ".gif"]
-        image_files = [
-            os.path.abspath(os.path.join(IMAGES_PATH, file))
-            for file in files
-            if os.path.splitext(file)[1].lower() in image_extensions
-        ]
-
-        return GetImagesResponse(
-            success=True,
-            message="Successfully retrieved all images",
-            data={"images": image_files},
+        st = os.stat(IMAGES_PATH_ABS)
+        mtime, etag, body = _images_cache["state"]
+        if st.st_mtime_ns != mtime:
+            with _images_cache_lock:
+                mtime, etag, body = _images_cache["state"]
+                if st.st_mtime_ns != mtime:
+                    with os.scandir(IMAGES_PATH_ABS) as entries:
+                        image_files = [
+                            entry.path
+                            for entry in entries
+                            if entry.is_file(follow_symlinks=False)
+                            and os.path.splitext(entry.name)[1].lower()
+                            in IMAGE_EXTENSIONS
+                        ]
+                    body = _get_images_adapter.dump_json(
+                        GetImagesResponse(
+                            success=True,
+                            message="Successfully retrieved all images",
+                            data={"images": image_files},
+                        )
+                    )
+                    etag = hashlib.blake2b(
+                        str(st.st_mtime_ns).encode(), digest_size=8
+                    ).hexdigest()
+                    _images_cache["state"] = (st.st_mtime_ns, etag, body)
+
+        headers = {"ETag": etag, "Cache-Control": "public,max-age=5"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=headers,
         )
 
     except Exception as e:
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ErrorResponse(
-                success=False, error="Internal server error", message=str(e)
-            ).model_dump(),
+        return err(
+            status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error", str(e)
         )
 
 
@@ -119,31 +170,24 @@ def add_single_image(payload: AddSingleImageRequest):
     try:
         image_path = payload.path
         if not os.path.isfile(image_path):
-
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorResponse(
-                    success=False,
-                    error="Invalid file path",
-                    message="The provided path is not a valid file",
-                ).model_dump(),
+            return err(
+                status.HTTP_400_BAD_REQUEST,
+                "Invalid file path",
+                "The provided path is not a valid file",
             )
 
-        image_extensions = [".jpg", ".jpeg", ".png", ".bmp", ".gif"]
         file_extension = os.path.splitext(image_path)[1].lower()
-        if file_extension not in image_extensions:
-
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorResponse(
-                    success=False,
-                    error="Invalid file type",
-                    message="The file is not a supported image type",
-                ),
+        if file_extension not in IMAGE_EXTENSIONS:
+            return err(
+                status.HTTP_400_BAD_REQUEST,
+                "Invalid file type",
+                "The file is not a supported image type",
             )
 
         destination_path = os.path.join(IMAGES_PATH, os.path.basename(image_path))
-        shutil.copy(image_path, destination_path)
+        # copyfile takes the zero-copy fast path (sendfile/copy_file_range
+        # on Linux) instead of bouncing bytes through userspace buffers
+        shutil.copyfile(image_path, destination_path)
 
         return (
             AddSingleImageResponse(
@@ -153,12 +197,8 @@ def add_single_image(payload: AddSingleImageRequest):
             ),
         )
     except Exception as e:
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ErrorResponse(
-                success=False, message="Internal server error", error=str(e)
-            ).model_dump(),
+        return err(
+            status.HTTP_500_INTERNAL_SERVER_ERROR, str(e), "Internal server error"
         )
 
 
@@ -179,9 +219,4 @@ def test_images():
         return TestImageResponse(success=True, message="Success")
 
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=ErrorResponse(
-                success=False, message="Internal server error", error=str(e)
-            ).model_dump(),
-        )
+        return err(status.HTTP_400_BAD_REQUEST, str(e), "Internal server error")
@@ -1,14 +1,17 @@
 from pydantic import BaseModel
-from typing import List, Dict
 
 # Request Model
 
 
 class TestRouteRequest(BaseModel):
+    model_config = {"extra": "forbid"}
+
     path: str
 
 
 class AddSingleImageRequest(BaseModel):
+    model_config = {"extra": "forbid"}
+
     path: str
 
 
@@ -16,8 +19,8 @@ class AddSingleImageRequest(BaseModel):
 
 
 class DetectionData(BaseModel):
-    class_ids: List[str | None]  # List of detected class IDs
-    detected_classes: List[str | None]  # List of class names
+    class_ids: list[str | None]  # List of detected class IDs
+    detected_classes: list[str | None]  # List of class names
 
 
 class TestRouteResponse(BaseModel):
@@ -29,13 +32,13 @@ class TestRouteResponse(BaseModel):
 class GetImagesResponse(BaseModel):
     success: bool
     message: str
-    data: Dict[str, List[str]]
+    data: dict[str, list[str]]
 
 
 class AddSingleImageResponse(BaseModel):
     success: bool
     message: str
-    data: Dict[str, str]
+    data: dict[str, str]
 
 
 class ErrorResponse(BaseModel):
@@ -1,7 +1,7 @@
 import time
 import cv2
 import numpy as np
-from app.utils.onnx_manager import onnx_session
+from app.utils.onnx_manager import create_onnx_session
 from app.yolov8.utils import xywh2xyxy, draw_detections, multiclass_nms
 from app.utils.memory_monitor import log_memory_usage
 
@@ -12,21 +12,22 @@ class YOLOv8:
         self.conf_threshold = conf_thres
         self.iou_threshold = iou_thres
 
-        # Initialize model info
-        with onnx_session(self.model_path) as session:
-            self.get_input_details(session)
-            self.get_output_details(session)
+        # One persistent session per detector: building an InferenceSession
+        # re-reads the weights from disk, so pay that cost here once instead
+        # of on every inference
+        self.session = create_onnx_session(self.model_path)
+        self.get_input_details(self.session)
+        self.get_output_details(self.session)
 
     def __call__(self, image):
         return self.detect_objects(image)
 
     @log_memory_usage
     def detect_objects(self, image):
-        with onnx_session(self.model_path) as session:
-            input_tensor = self.prepare_input(image)
-            outputs = self.inference(session, input_tensor)
-            self.boxes, self.scores, self.class_ids = self.process_output(outputs)
-            return self.boxes, self.scores, self.class_ids
+        input_tensor = self.prepare_input(image)
+        outputs = self.inference(self.session, input_tensor)
+        self.boxes, self.scores, self.class_ids = self.process_output(outputs)
+        return self.boxes, self.scores, self.class_ids
 
     def inference(self, session, input_tensor):
         time.perf_counter()
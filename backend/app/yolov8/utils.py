@@ -84,6 +84,10 @@ class_names = [
     "toothbrush",
 ]
 
+# Object-dtype copy of class_names so id -> name lookups can use one fancy
+# index instead of a Python loop per detection
+class_names_arr = np.array(class_names, dtype=object)
+
 # Create a list of colors for each class where each color is a tuple of 3 integer values
 rng = np.random.default_rng(3)
 colors = rng.uniform(0, 255, size=(len(class_names), 3))
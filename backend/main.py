@@ -5,13 +5,19 @@ This module contains the main FastAPI application.
 from uvicorn import Config, Server
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.database.faces import cleanup_face_embeddings, create_faces_table
 from app.database.images import create_image_id_mapping_table, create_images_table
 from app.database.albums import create_albums_table
 from app.database.yolo_mapping import create_YOLO_mappings
 from app.database.folders import create_folders_table
+from app.config.settings import DEFAULT_FACE_DETECTION_MODEL
 from app.facecluster.init_face_cluster import get_face_cluster, init_face_cluster
+from app.utils.batch_inference import batch_worker
+from app.yolov8.YOLOv8 import YOLOv8
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from app.routes.test import router as test_router
 from app.routes.images import router as images_router
 from app.routes.albums import router as albums_router
@@ -36,13 +42,35 @@ async def lifespan(app: FastAPI):
     create_albums_table()
     cleanup_face_embeddings()
     init_face_cluster()
+    # Load the face detection model once so requests reuse the same detector
+    # instead of re-initializing the ONNX session on every call.
+    app.state.yolov8_detector = YOLOv8(
+        DEFAULT_FACE_DETECTION_MODEL, conf_thres=0.2, iou_thres=0.3
+    )
+    # Micro-batching worker: concurrent detection requests are grouped off
+    # an asyncio.Queue and run together instead of one executor hop each.
+    # Thread pool for blocking file I/O (image decode, copies) so it never
+    # runs on the event loop.
+    app.state.io_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    # Background classification is CPU-heavy; cap it at two concurrent jobs
+    # on a dedicated pool so bursts cannot flood the default executor.
+    app.state.classify_sem = asyncio.Semaphore(2)
+    app.state.classify_pool = ThreadPoolExecutor(max_workers=2)
+    app.state.inference_queue = asyncio.Queue()
+    app.state.batch_worker_task = asyncio.create_task(
+        batch_worker(app.state.inference_queue, app.state.yolov8_detector)
+    )
     yield
+    app.state.batch_worker_task.cancel()
+    app.state.io_pool.shutdown(wait=False)
+    app.state.classify_pool.shutdown(wait=False)
     face_cluster = get_face_cluster()
     if face_cluster:
         face_cluster.save_to_db()
 
 
-app = FastAPI(lifespan=lifespan)
+# ORJSONResponse serializes through orjson (Rust) instead of stdlib json
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 start_scheduler()
 
@@ -72,6 +100,17 @@ app.include_router(tagging_router, prefix="/tag", tags=["Tagging"])
 if __name__ == "__main__":
     multiprocessing.freeze_support()  # Required for Windows.
     app.logger = CustomizeLogger.make_logger("app/logging_config.json")
-    config = Config(app=app, host="0.0.0.0", port=8000, log_config=None)
+    # loop="auto" picks uvloop where it is installed (non-Windows) and
+    # httptools replaces the pure-Python h11 parser. Kept single-worker:
+    # the detector, batch worker and caches on app.state are per-process,
+    # and extra workers would load a model copy each.
+    config = Config(
+        app=app,
+        host="0.0.0.0",
+        port=8000,
+        log_config=None,
+        loop="auto",
+        http="httptools",
+    )
     server = Server(config)
     server.run()
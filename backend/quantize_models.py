@@ -0,0 +1,35 @@
+"""
+One-shot INT8 quantization of the face detection model.
+
+Run from the backend directory:
+
+    python quantize_models.py
+
+Writes app/models/yolov8n-face-int8.onnx next to the FP32 model. Face
+detection tolerates reduced precision well, and INT8 weights roughly halve
+memory bandwidth while enabling int8 kernels on CPUs that have them.
+app/config/settings.py automatically prefers the INT8 model when the file
+exists, so no code change is needed after running this. If detection quality
+drops noticeably, delete the generated file to fall back to FP32.
+"""
+
+import os
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+FP32_MODEL = "app/models/yolov8n-face.onnx"
+INT8_MODEL = "app/models/yolov8n-face-int8.onnx"
+
+
+def main():
+    if not os.path.exists(FP32_MODEL):
+        raise SystemExit(
+            f"Model not found: {FP32_MODEL} (run from the backend directory)"
+        )
+
+    quantize_dynamic(FP32_MODEL, INT8_MODEL, weight_type=QuantType.QInt8)
+    print(f"Wrote {INT8_MODEL}")
+
+
+if __name__ == "__main__":
+    main()
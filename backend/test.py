@@ -1,35 +1,70 @@
 import sqlite3
-import json
 import numpy as np
 from sklearn.cluster import DBSCAN
 from app.config.settings import DATABASE_PATH
+from app.database.faces import EMB_DIM, decode_embeddings
+
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True)
+    def l2_normalize_rows(x):
+        for i in prange(x.shape[0]):
+            s = 0.0
+            for j in range(x.shape[1]):
+                s += x[i, j] * x[i, j]
+            if s > 0.0:
+                inv = 1.0 / np.sqrt(s)
+                for j in range(x.shape[1]):
+                    x[i, j] *= inv
+
+except ImportError:
+    # Numba is optional; plain NumPy does the same normalization in-place
+    def l2_normalize_rows(x):
+        norms = np.linalg.norm(x, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        x /= norms
+
+
+try:
+    from cluster_numba import dbscan_cosine
+except ImportError:
+    dbscan_cosine = None
 
 
 def get_all_face_embeddings():
     conn = sqlite3.connect(DATABASE_PATH)
     cursor = conn.cursor()
 
-    cursor.execute("SELECT image_id, embeddings FROM faces")
-    results = cursor.fetchall()
+    # Single JOIN instead of one path lookup per face row (N+1 pattern)
+    cursor.execute(
+        """
+        SELECT f.embeddings, m.path
+        FROM faces f
+        JOIN image_id_mapping m ON m.id = f.image_id
+        """
+    )
 
     all_embeddings = []
     image_paths = []
     skipped_images = []
-    for image_id, embeddings_json in results:
-        cursor.execute("SELECT path FROM image_id_mapping WHERE id = ?", (image_id,))
-        image_path = cursor.fetchone()[0]
-        embeddings = np.array(json.loads(embeddings_json))
+    # Stream rows off the cursor instead of materializing every (blob, path)
+    # tuple up front with fetchall(); each blob is decoded and dropped as we go
+    for stored_embeddings, image_path in cursor:
+        embeddings = decode_embeddings(stored_embeddings)
 
         # Skip images with more than 10 faces
         if len(embeddings) > 10:
             skipped_images.append(image_path)
             continue
 
-        all_embeddings.extend(embeddings)
+        all_embeddings.append(embeddings)
         image_paths.extend([image_path] * len(embeddings))
 
     conn.close()
-    return np.array(all_embeddings), image_paths, skipped_images
+    if not all_embeddings:
+        return np.empty((0, EMB_DIM), dtype=np.float32), image_paths, skipped_images
+    return np.vstack(all_embeddings), image_paths, skipped_images
 
 
 def main():
@@ -40,8 +75,25 @@ def main():
     for path in skipped_images:
         print(f"  {path}")
 
-    dbscan = DBSCAN(eps=0.3, min_samples=2, metric="cosine")
-    cluster_labels = dbscan.fit_predict(embedding_array)
+    # sklearn's cosine metric forces a brute-force O(N^2) distance matrix.
+    # On L2-normalized vectors ||a-b||^2 = 2 * cosine_distance(a, b), so the
+    # same neighborhoods come from euclidean eps = sqrt(2 * 0.3) with a
+    # ball tree (O(N log N) neighbor queries).
+    embedding_array = np.ascontiguousarray(embedding_array, dtype=np.float32)
+    l2_normalize_rows(embedding_array)
+
+    if dbscan_cosine is not None:
+        # Numba kernel: parallel range queries + native label expansion
+        cluster_labels = dbscan_cosine(embedding_array, eps=0.3, min_samples=2)
+    else:
+        dbscan = DBSCAN(
+            eps=np.sqrt(2 * 0.3),
+            min_samples=2,
+            metric="euclidean",
+            algorithm="ball_tree",
+            n_jobs=-1,
+        )
+        cluster_labels = dbscan.fit_predict(embedding_array)
 
     clusters = {}
     for path, label in zip(image_paths, cluster_labels):
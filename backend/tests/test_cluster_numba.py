@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+
+numba = pytest.importorskip("numba")
+
+from cluster_numba import dbscan_cosine  # noqa: E402
+
+
+def _clustered_embeddings(n=300, dim=64, seed=1):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(n, dim)).astype(np.float32)
+    # Two tight clusters plus background noise
+    x[:40] = x[0] + rng.normal(scale=0.02, size=(40, dim))
+    x[100:140] = x[100] + rng.normal(scale=0.02, size=(40, dim))
+    x /= np.linalg.norm(x, axis=1, keepdims=True)
+    return x
+
+
+def test_dbscan_cosine_matches_sklearn():
+    x = _clustered_embeddings()
+
+    reference = DBSCAN(eps=0.3, min_samples=2, metric="cosine").fit_predict(x)
+    labels = dbscan_cosine(x, eps=0.3, min_samples=2)
+
+    # Same noise points, and the same partition of the clustered points
+    # (cluster ids themselves are arbitrary)
+    assert ((reference == -1) == (labels == -1)).all()
+    for cluster_id in set(labels) - {-1}:
+        members = reference[labels == cluster_id]
+        assert len(set(members)) == 1
+
+
+def test_dbscan_cosine_all_noise():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=(50, 64)).astype(np.float32)
+    x /= np.linalg.norm(x, axis=1, keepdims=True)
+
+    labels = dbscan_cosine(x, eps=0.01, min_samples=2)
+
+    assert (labels == -1).all()
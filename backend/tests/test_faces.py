@@ -0,0 +1,32 @@
+import json
+import numpy as np
+from app.database.faces import EMB_DIM, decode_embeddings
+
+
+def test_decode_embeddings_float32_blob():
+    embeddings = np.random.rand(3, EMB_DIM).astype(np.float32)
+
+    decoded = decode_embeddings(embeddings.tobytes())
+
+    assert decoded.shape == (3, EMB_DIM)
+    assert decoded.dtype == np.float32
+    assert np.array_equal(decoded, embeddings)
+
+
+def test_decode_embeddings_legacy_json():
+    # Rows written before the BLOB migration hold JSON text
+    embeddings = np.random.rand(2, EMB_DIM).astype(np.float32)
+
+    decoded = decode_embeddings(json.dumps(embeddings.tolist()))
+
+    assert decoded.shape == (2, EMB_DIM)
+    assert np.allclose(decoded, embeddings, atol=1e-6)
+
+
+def test_decode_embeddings_single_face():
+    embeddings = np.random.rand(1, EMB_DIM).astype(np.float32)
+
+    decoded = decode_embeddings(embeddings.tobytes())
+
+    assert decoded.shape == (1, EMB_DIM)
+    assert np.array_equal(decoded, embeddings)
@@ -0,0 +1,32 @@
+from main import app
+from fastapi.testclient import TestClient
+
+client = TestClient(app)
+
+
+def test_get_images_returns_etag():
+    response = client.get("/test/images")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["success"] is True
+    assert isinstance(data["data"]["images"], list)
+
+    assert response.headers.get("ETag")
+    assert "max-age" in response.headers.get("Cache-Control", "")
+
+
+def test_get_images_matching_etag_returns_304():
+    response = client.get("/test/images")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    cached = client.get("/test/images", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+
+def test_get_images_stale_etag_returns_full_response():
+    response = client.get("/test/images", headers={"If-None-Match": "stale-etag"})
+    assert response.status_code == 200
+    assert response.json()["success"] is True